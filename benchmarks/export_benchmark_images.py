@@ -5,8 +5,62 @@
 # ///
 import os
 import shutil
-import glob
+import sys
 import datetime
+import json
+
+# Chunk size for the userspace fallback copy
+_COPY_BUFSIZE = 1024 * 1024
+
+# Records what the previous export wrote, stored in the source directory
+_MANIFEST_NAME = ".last_export.json"
+
+
+def _fast_copy(src, dst):
+    """
+    Copy src to dst, preferring in-kernel copies over a userspace read/write loop.
+
+    Tries os.copy_file_range (reflink-capable on XFS/Btrfs), then os.sendfile, and
+    finally shutil.copyfileobj. Only data is copied: exports go to a freshly created
+    directory, so default permissions and a current mtime are fine.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(src_fd).st_size
+
+        kernel_copies = []
+        if hasattr(os, "copy_file_range"):
+            kernel_copies.append(lambda count: os.copy_file_range(src_fd, dst_fd, count))
+        if hasattr(os, "sendfile"):
+            kernel_copies.append(lambda count: os.sendfile(dst_fd, src_fd, None, count))
+
+        for copy_chunk in kernel_copies:
+            try:
+                while remaining > 0 and (copied := copy_chunk(remaining)):
+                    remaining -= copied
+            except OSError:
+                # Not supported for this file/filesystem pair, try the next strategy
+                pass
+
+            if remaining == 0:
+                break
+
+            # A strategy may copy nothing (returning 0) or stop early: restart the copy with the next one
+            remaining = os.fstat(src_fd).st_size
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+        else:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
+
+def _load_manifest(manifest_path):
+    """Load the previous export manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
 
 def export_benchmark_images():
@@ -34,20 +88,51 @@ def export_benchmark_images():
     # Find the latest image of each type
     image_types = {}
 
-    for image_path in glob.glob(f"{source_dir}/*.png"):
-        filename = os.path.basename(image_path)
-        # Extract the base name (removing timestamp)
-        base_name = "_".join(filename.split("_")[:-1])
+    # Stat each entry once via scandir and keep (mtime, path) so the incumbent is never re-statted
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".png") or not entry.is_file(follow_symlinks=False):
+                continue
+
+            mtime = entry.stat().st_mtime
+            # Extract the base name (removing timestamp)
+            base_name = entry.name.rpartition("_")[0]
+
+            if base_name not in image_types or mtime > image_types[base_name][0]:
+                image_types[base_name] = (mtime, entry.path)
 
-        if base_name not in image_types or os.path.getmtime(image_path) > os.path.getmtime(image_types[base_name]):
-            image_types[base_name] = image_path
+    manifest_path = os.path.join(source_dir, _MANIFEST_NAME)
+    previous = _load_manifest(manifest_path)
+    manifest = {}
+    exported = []
 
-    # Copy the latest images to the export directory
-    for base_name, image_path in image_types.items():
+    # Copy the latest images to the export directory, hard-linking unchanged ones from the previous export
+    for base_name, (mtime, image_path) in image_types.items():
         new_filename = f"{base_name}.png"
         destination = os.path.join(export_dir, new_filename)
-        shutil.copy2(image_path, destination)
-        print(f"Exported: {new_filename}")
+
+        linked = False
+        prev = previous.get(base_name)
+        if prev and prev.get("source") == image_path and prev.get("mtime") == mtime:
+            try:
+                os.link(prev["export"], destination)
+                linked = True
+            except OSError:
+                # Previous export was removed or is on another filesystem
+                pass
+
+        if not linked:
+            _fast_copy(image_path, destination)
+
+        manifest[base_name] = {"source": image_path, "mtime": mtime, "export": destination}
+        exported.append(new_filename)
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    # Report all exported files with a single write
+    if exported:
+        sys.stdout.write("Exported:\n  " + "\n  ".join(exported) + "\n")
 
     print(f"\nAll benchmark images have been exported to: {export_dir}")
     return True
@@ -7,99 +7,140 @@
 #   "pandas",
 # ]
 # ///
+import concurrent.futures
+import functools
 import os
 import re
 import pandas as pd
+import matplotlib
+
+# Select the non-interactive backend before pyplot is imported so no GUI toolkit is loaded
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
-# Configure matplotlib for better output
-plt.style.use("ggplot")
-plt.rcParams["figure.figsize"] = (12, 8)
-plt.rcParams["font.size"] = 12
-
-# Create output directory for visualizations
+# Output directory for visualizations (created by main)
 output_dir = "dist/benchmark_visualizations"
-os.makedirs(output_dir, exist_ok=True)
+
+# Benchmark output patterns, compiled once at import time. They match raw bytes so the
+# output files never need to be decoded; \xc2\xb5 is the UTF-8 encoding of "µ".
+_METRIC_RE = re.compile(rb"(Average|Min|Max):\s+([0-9.]+)\s*(\xc2\xb5s|ms|s)\b")
+_SECTION_RE = re.compile(rb"=== Benchmark: ")
+_FILE_SIZE_RE = re.compile(rb"Test 'Process ([0-9]+)KB files \([0-9]+\)' completed in ([0-9.]+)\s*(\xc2\xb5s|ms|s)\b")
+_THREAD_RE = re.compile(rb"Test 'Process with ([0-9]+) threads' completed in ([0-9.]+)\s*(\xc2\xb5s|ms|s)\b")
+
+# Multipliers converting each duration unit to milliseconds
+_UNIT = {b"ms": 1.0, b"\xc2\xb5s": 0.001, b"s": 1000.0}
+_UNIT_INDEX = {unit: i for i, unit in enumerate(_UNIT)}
+_UNIT_SCALES = np.array(list(_UNIT.values()), dtype=np.float64)
+
+# Below this many values the NumPy setup cost outweighs the vectorized multiply
+_VECTORIZE_THRESHOLD = 64
 
 
-# Function to read benchmark output from saved files
+# Configure matplotlib for better output; runs in main and in each worker process, never at import time
+def _configure():
+    plt.style.use("ggplot")
+    plt.rcParams["figure.figsize"] = (12, 8)
+    plt.rcParams["font.size"] = 12
+
+
+# Function to read benchmark output from saved files (cached so each file is read once per run)
+@functools.lru_cache(maxsize=None)
 def read_benchmark_output(test_name):
     print(f"Reading benchmark data for: {test_name}")
     output_file = f"/tmp/{test_name}_output.txt"
 
     try:
-        with open(output_file, "r") as f:
+        with open(output_file, "rb", buffering=262144) as f:
             return f.read()
     except FileNotFoundError:
         print(f"Warning: Benchmark output file not found: {output_file}")
-        return ""
+        return b""
+
+
+# Function to convert (value, unit) pairs captured by the regexes to milliseconds
+def extract_durations(pairs):
+    if len(pairs) < _VECTORIZE_THRESHOLD:
+        return [float(num) * _UNIT[unit] for num, unit in pairs]
+
+    nums = np.fromiter((float(num) for num, _ in pairs), dtype=np.float64, count=len(pairs))
+    idx = np.fromiter((_UNIT_INDEX[unit] for _, unit in pairs), dtype=np.int8, count=len(pairs))
+    return (nums * _UNIT_SCALES[idx]).tolist()
 
 
-# Function to extract durations from benchmark output
-def extract_durations(output, pattern):
-    matches = re.findall(pattern, output)
-    durations = []
+# Function to extract (integer label, duration in ms) series from a compiled "completed in" pattern
+def extract_timed_results(pattern, output):
+    labels = []
+    pairs = []
+    # Stream matches instead of materializing the full findall list
+    for match in pattern.finditer(output):
+        label, num, unit = match.groups()
+        labels.append(int(label))
+        pairs.append((num, unit))
+    return labels, extract_durations(pairs)
 
-    for match in matches:
-        # Convert to milliseconds for consistency
-        if "ms" in match:
-            durations.append(float(match.replace("ms", "").strip()))
-        elif "µs" in match:
-            durations.append(float(match.replace("µs", "").strip()) / 1000)
-        elif "s" in match:
-            durations.append(float(match.replace("s", "").strip()) * 1000)
 
-    return durations
+# Function to sort thread count measurements by thread count
+def sort_by_thread_count(thread_counts, durations):
+    thread_counts = np.asarray(thread_counts, dtype=np.int32)
+    durations = np.asarray(durations, dtype=np.float64)
+    order = np.argsort(thread_counts)
+    return thread_counts[order], durations[order]
+
+
+# Function to build one standalone Agg figure per chart (kept out of pyplot's figure registry)
+def create_figure():
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    return fig
 
 
 # Function to save the figure with timestamp
 def save_figure(fig, filename):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = os.path.join(output_dir, f"{filename}_{timestamp}.png")
-    fig.savefig(path, dpi=150, bbox_inches="tight")
+    # Every chart calls tight_layout() before saving, so skip the extra bbox_inches="tight" render pass
+    # Fast zlib level: encoding dominates per-chart CPU, and these PNGs are not size-critical
+    fig.savefig(path, dpi=150, pil_kwargs={"compress_level": 1, "optimize": False})
     print(f"Saved figure to {path}")
     return path
 
 
 # Test 1: Operation Type Comparison
-def run_operation_type_benchmark():
+# Function to parse the average/min/max timings of each operation from the benchmark output
+def _load_operation_metrics():
     print("\n=== Running Operation Type Benchmark ===")
     output = read_benchmark_output("benchmark_operations")
 
-    # Extract statistics from the output
-    avg_pattern = r"Average:\s+([0-9.]+[µms]+)"
-    min_pattern = r"Min:\s+([0-9.]+[µms]+)"
-    max_pattern = r"Max:\s+([0-9.]+[µms]+)"
-
     operations = ["Add License", "Update Year", "Check License"]
     metrics = {"Average": [], "Min": [], "Max": []}
 
     # Find the sections for each operation
-    sections = re.split(r"=== Benchmark: ", output)[1:]  # Skip the first element which is before any benchmark
+    sections = _SECTION_RE.split(output)[1:]  # Skip the first element which is before any benchmark
 
     for i, section in enumerate(sections):
         if i < len(operations):
-            avg_matches = re.findall(avg_pattern, section)
-            min_matches = re.findall(min_pattern, section)
-            max_matches = re.findall(max_pattern, section)
+            # Single scan per section; keep the first value reported for each metric
+            section_metrics = {}
+            for match in _METRIC_RE.finditer(section):
+                kind, num, unit = match.groups()
+                section_metrics.setdefault(kind.decode("ascii"), float(num) * _UNIT[unit])
 
-            if avg_matches:
-                avg_duration = extract_durations(avg_matches[0], r"([0-9.]+[µms]+)")[0]
-                metrics["Average"].append(avg_duration)
+            for kind, duration in section_metrics.items():
+                metrics[kind].append(duration)
 
-            if min_matches:
-                min_duration = extract_durations(min_matches[0], r"([0-9.]+[µms]+)")[0]
-                metrics["Min"].append(min_duration)
+    return pd.DataFrame(metrics, index=operations)
 
-            if max_matches:
-                max_duration = extract_durations(max_matches[0], r"([0-9.]+[µms]+)")[0]
-                metrics["Max"].append(max_duration)
 
+# Function to draw the operation comparison bar chart onto an axes
+def _draw_operation_chart(ax, df):
     # Create a grouped bar chart
-    df = pd.DataFrame(metrics, index=operations)
-    ax = df.plot(kind="bar", figsize=(12, 8))
+    df.plot(kind="bar", ax=ax)
     ax.set_ylabel("Time (milliseconds)")
     ax.set_title("Performance by Operation Type")
 
@@ -107,35 +148,31 @@ def run_operation_type_benchmark():
     for container in ax.containers:
         ax.bar_label(container, fmt="%.1f", padding=3)
 
-    plt.legend(title="Metric")
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
-    plt.tight_layout()
+    ax.legend(title="Metric")
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
 
-    return save_figure(plt.gcf(), "operation_type_comparison")
+
+def run_operation_type_benchmark(fig, df):
+    fig.clear()
+    _draw_operation_chart(fig.add_subplot(111), df)
+    fig.tight_layout()
+
+    return save_figure(fig, "operation_type_comparison")
 
 
 # Test 2: File Size Impact
-def run_file_size_benchmark():
+# Function to parse the (file size, duration) results from the benchmark output
+def _load_file_size_results():
     print("\n=== Running File Size Impact Benchmark ===")
     output = read_benchmark_output("test_file_size_impact")
 
     # Extract duration information
-    pattern = r"Test 'Process ([0-9]+)KB files \([0-9]+\)' completed in ([0-9.]+[µms]+)"
-    matches = re.findall(pattern, output)
-
-    file_sizes = []
-    durations = []
+    return extract_timed_results(_FILE_SIZE_RE, output)
 
-    for match in matches:
-        file_size = int(match[0])
-        duration_str = match[1]
-        duration = extract_durations(duration_str, r"([0-9.]+[µms]+)")[0]
-
-        file_sizes.append(file_size)
-        durations.append(duration)
 
+# Function to draw the file size impact bar chart onto an axes
+def _draw_file_size_chart(ax, file_sizes, durations):
     # Create a bar chart
-    fig, ax = plt.subplots(figsize=(12, 8))
     bars = ax.bar(range(len(file_sizes)), durations, tick_label=[f"{size}KB" for size in file_sizes])
 
     # Add value labels on top of bars
@@ -144,38 +181,33 @@ def run_file_size_benchmark():
     ax.set_xlabel("File Size")
     ax.set_ylabel("Time (milliseconds)")
     ax.set_title("Impact of File Size on Processing Performance")
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
-    plt.tight_layout()
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+
+def run_file_size_benchmark(fig, file_sizes, durations):
+    fig.clear()
+    _draw_file_size_chart(fig.add_subplot(111), file_sizes, durations)
+    fig.tight_layout()
 
-    return save_figure(plt.gcf(), "file_size_impact")
+    return save_figure(fig, "file_size_impact")
 
 
 # Test 3: Thread Count Impact
-def run_thread_count_benchmark():
+# Function to parse the (thread count, duration) results, sorted by thread count
+def _load_thread_count_results():
     print("\n=== Running Thread Count Impact Benchmark ===")
     output = read_benchmark_output("test_thread_count_impact")
 
     # Extract duration information
-    pattern = r"Test 'Process with ([0-9]+) threads' completed in ([0-9.]+[µms]+)"
-    matches = re.findall(pattern, output)
-
-    thread_counts = []
-    durations = []
-
-    for match in matches:
-        thread_count = int(match[0])
-        duration_str = match[1]
-        duration = extract_durations(duration_str, r"([0-9.]+[µms]+)")[0]
-
-        thread_counts.append(thread_count)
-        durations.append(duration)
+    thread_counts, durations = extract_timed_results(_THREAD_RE, output)
 
     # Sort by thread count
-    sorted_data = sorted(zip(thread_counts, durations))
-    thread_counts, durations = zip(*sorted_data) if sorted_data else ([], [])
+    return sort_by_thread_count(thread_counts, durations)
+
 
+# Function to draw the thread count impact line chart onto an axes, marking the fastest thread count
+def _draw_thread_count_chart(ax, thread_counts, durations):
     # Create a line chart
-    fig, ax = plt.subplots(figsize=(12, 8))
     ax.plot(thread_counts, durations, "o-", linewidth=2, markersize=10)
 
     # Add value labels
@@ -189,14 +221,14 @@ def run_thread_count_benchmark():
     ax.set_xticklabels(thread_counts)
 
     # Add horizontal lines for better readability
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
 
     # Calculate and display optimal thread count based on performance
-    if durations:
-        min_duration_idx = durations.index(min(durations))
+    if len(durations):
+        min_duration_idx = np.argmin(durations)
         optimal_threads = thread_counts[min_duration_idx]
-        plt.axvline(x=optimal_threads, color="r", linestyle="--", alpha=0.5)
-        plt.text(
+        ax.axvline(x=optimal_threads, color="r", linestyle="--", alpha=0.5)
+        ax.text(
             optimal_threads,
             max(durations) * 0.5,
             f"Optimal: {optimal_threads} threads",
@@ -205,18 +237,24 @@ def run_thread_count_benchmark():
             color="r",
         )
 
-    plt.tight_layout()
 
-    return save_figure(plt.gcf(), "thread_count_impact")
+def run_thread_count_benchmark(fig, thread_counts, durations):
+    fig.clear()
+    _draw_thread_count_chart(fig.add_subplot(111), thread_counts, durations)
+    fig.tight_layout()
+
+    return save_figure(fig, "thread_count_impact")
 
 
 # Test 4: Combined Visualization - Thread Count Efficiency
-def generate_thread_efficiency_visualization(thread_data):
+# Function to compute ideal times and parallel efficiency (None if there is no usable single-thread baseline)
+def _compute_thread_efficiency(thread_data):
     if not thread_data or len(thread_data[0]) < 2:
         print("Not enough thread data for efficiency visualization")
         return None
 
-    thread_counts, durations = thread_data
+    thread_counts = np.asarray(thread_data[0])
+    durations = np.asarray(thread_data[1], dtype=np.float64)
 
     if len(thread_counts) < 2:
         print("Need at least two thread count data points for efficiency visualization")
@@ -229,12 +267,19 @@ def generate_thread_efficiency_visualization(thread_data):
         print("Missing single-thread benchmark data")
         return None
 
-    ideal_times = [single_thread_time / t for t in thread_counts]
-    efficiency = [100 * (single_thread_time / (t * duration)) for t, duration in zip(thread_counts, durations)]
+    # Vectorized float64 arithmetic; integer thread counts are kept for the x-axis ticks
+    threads = thread_counts.astype(np.float64)
+    ideal_times = single_thread_time / threads
+    efficiency = 100.0 * single_thread_time / (threads * durations)
 
-    # Create a plot with two y-axes
-    fig, ax1 = plt.subplots(figsize=(12, 8))
+    return thread_counts, durations, ideal_times, efficiency
+
+
+# Function to draw actual vs ideal times and parallel efficiency on twin y-axes
+def _draw_efficiency_chart(ax1, efficiency_data):
+    thread_counts, durations, ideal_times, efficiency = efficiency_data
 
+    # Create a plot with two y-axes
     color1 = "tab:blue"
     ax1.set_xlabel("Number of Threads")
     ax1.set_ylabel("Time (milliseconds)", color=color1)
@@ -251,7 +296,7 @@ def generate_thread_efficiency_visualization(thread_data):
     ax2.tick_params(axis="y", labelcolor=color2)
 
     # Set y-range for efficiency to start from 0 to 100+
-    max_efficiency = max(efficiency) if efficiency else 100
+    max_efficiency = efficiency.max()
     ax2.set_ylim([0, max(105, max_efficiency * 1.1)])
 
     # Add a reference line at 100% efficiency
@@ -265,40 +310,78 @@ def generate_thread_efficiency_visualization(thread_data):
     ax1.set_title("Thread Scaling Performance and Efficiency")
     ax1.grid(True, linestyle="--", alpha=0.7)
 
-    plt.tight_layout()
 
-    return save_figure(plt.gcf(), "thread_efficiency")
+def generate_thread_efficiency_visualization(fig, efficiency_data):
+    fig.clear()
+    _draw_efficiency_chart(fig.add_subplot(111), efficiency_data)
+    fig.tight_layout()
 
+    return save_figure(fig, "thread_efficiency")
 
-# Main function to run all benchmarks
-def main():
-    print("Generating benchmark visualizations for edlicense...")
 
-    # For demonstration, create a summary chart with mock data
-    # This will be replaced with actual data when the benchmarks are run
-    operation_chart = run_operation_type_benchmark()
-    file_size_chart = run_file_size_benchmark()
-    thread_chart = run_thread_count_benchmark()
+# Summary dashboard: all four charts on one 2x2 figure, encoded with a single savefig
+def _generate_summary_dashboard(fig, operation_df, file_size_data, thread_data, efficiency_data):
+    fig.clear()
+    fig.set_size_inches(20, 14)
+    axes = fig.subplots(2, 2)
 
-    # Extract thread count data for efficiency visualization
-    thread_pattern = r"Test 'Process with ([0-9]+) threads' completed in ([0-9.]+[µms]+)"
-    thread_output = read_benchmark_output("test_thread_count_impact")
+    _draw_operation_chart(axes[0, 0], operation_df)
+    _draw_file_size_chart(axes[0, 1], *file_size_data)
+    _draw_thread_count_chart(axes[1, 0], *thread_data)
 
-    thread_matches = re.findall(thread_pattern, thread_output)
-    thread_counts = []
-    durations = []
+    if efficiency_data is None:
+        axes[1, 1].set_axis_off()
+    else:
+        _draw_efficiency_chart(axes[1, 1], efficiency_data)
 
-    for match in thread_matches:
-        thread_counts.append(int(match[0]))
-        durations.append(extract_durations(match[1], r"([0-9.]+[µms]+)")[0])
+    fig.tight_layout()
 
-    # Sort by thread count
-    sorted_data = sorted(zip(thread_counts, durations))
-    thread_counts, durations = zip(*sorted_data) if sorted_data else ([], [])
+    return save_figure(fig, "summary_dashboard")
+
+
+# Function run in a worker process to render one chart onto its own figure
+def render_chart(chart_fn, *args):
+    return chart_fn(create_figure(), *args)
 
-    # Generate the thread efficiency visualization
-    if thread_counts and durations:
-        efficiency_chart = generate_thread_efficiency_visualization((thread_counts, durations))
+
+# Main function to run all benchmarks
+def main():
+    print("Generating benchmark visualizations for edlicense...")
+
+    # Create output directory for visualizations
+    os.makedirs(output_dir, exist_ok=True)
+    _configure()
+
+    # Parse every benchmark output once; the charts below only receive the extracted data
+    operation_df = _load_operation_metrics()
+    file_size_data = _load_file_size_results()
+    thread_data = _load_thread_count_results()
+
+    # Extract thread count data for efficiency visualization
+    efficiency_data = _compute_thread_efficiency(thread_data) if len(thread_data[0]) else None
+
+    # The charts are independent and CPU-bound (the Agg rasterizer holds the GIL), so render them in processes
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4, initializer=_configure) as executor:
+        futures = [
+            executor.submit(render_chart, run_operation_type_benchmark, operation_df),
+            executor.submit(render_chart, run_file_size_benchmark, *file_size_data),
+            executor.submit(render_chart, run_thread_count_benchmark, *thread_data),
+            executor.submit(
+                render_chart, _generate_summary_dashboard, operation_df, file_size_data, thread_data, efficiency_data
+            ),
+        ]
+
+        # Generate the thread efficiency visualization
+        if efficiency_data is not None:
+            futures.append(executor.submit(render_chart, generate_thread_efficiency_visualization, efficiency_data))
+
+        # Surface any exception raised while rendering in a worker
+        for future in futures:
+            future.result()
+
+    # Release the cached benchmark outputs now that all charts are rendered
+    read_benchmark_output.cache_clear()
+    plt.close("all")
 
     # Create comparison of all operations
     print("\nAll benchmark visualizations have been generated in the 'benchmark_visualizations' directory.")
@@ -4,7 +4,9 @@
 # dependencies = [
 #   "matplotlib",
 #   "numpy",
+#   "orjson",
 #   "pandas",
+#   "pyarrow",
 # ]
 # ///
 """
@@ -14,311 +16,386 @@ generates visualizations comparing the performance of both tools.
 """
 
 import argparse
-import json
+import base64
+import io
 import os
-import glob
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+import orjson
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
 import numpy as np
-import re
 
 COMPARATIVE_OPERATIONS = ["add", "check"]
+DEFAULT_DPI = 120
+COMPARED_TOOLS = ["edlicense", "addlicense"]
+GROUP_KEYS = ["tool", "operation", "file_size_kb"]
+
+# Columns of the summary table, in display order
+SUMMARY_COLUMNS = [
+    "Operation",
+    "File Size (KB)",
+    "File Count",
+    "edlicense (ms)",
+    "addlicense (ms)",
+    "Ratio (addlicense/edlicense)",
+    "Percent Difference",
+]
+
+# Source files holding the per-operation benchmarks (as opposed to thread/chaotic/strict runs)
+OPERATION_SOURCE_PATTERN = re.compile(r"add|update|check")
+# Source files holding the thread count benchmarks
+THREAD_SOURCE_PATTERN = re.compile(r"thread_impact")
+
+
+def _load_result_file(entry):
+    """Parse one benchmark JSON file (a DirEntry) into an Arrow table, tagging each result with the file name."""
+    try:
+        with open(entry.path, "rb") as f:
+            table = pa.Table.from_pylist(orjson.loads(f.read()))
+    except Exception as e:
+        print(f"Error loading {entry.path}: {e}")
+        return None
+
+    return table.append_column("source_file", pa.array([entry.name] * table.num_rows, pa.string()))
+
+
+def _merge_result_tables(loaded):
+    """Concatenate the per-file Arrow tables, skipping any file whose column types cannot be merged."""
+    merged = None
+    for entry, table in loaded:
+        if merged is None:
+            merged = table
+            continue
+
+        try:
+            # Permissive promotion widens mismatched types, e.g. an int64 column in one file and double in another
+            merged = pa.concat_tables([merged, table], promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            print(f"Error loading {entry.path}: {e}")
+
+    return merged
 
 
 def load_benchmark_results(results_dir):
     """Load all benchmark JSON files from the specified directory."""
-    all_results = []
+    # Find all JSON files in the results directory; scandir's entries carry the name without extra stats
+    try:
+        with os.scandir(results_dir) as it:
+            json_files = [
+                entry
+                for entry in it
+                if entry.name.startswith("benchmark_") and entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return pd.DataFrame()
 
-    # Find all JSON files in the results directory
-    json_files = glob.glob(os.path.join(results_dir, "benchmark_*.json"))
+    if not json_files:
+        return pd.DataFrame()
 
-    for file_path in json_files:
-        try:
-            with open(file_path, "r") as f:
-                results = json.load(f)
-                # Add the filename as a reference
-                for result in results:
-                    result["source_file"] = os.path.basename(file_path)
-                all_results.extend(results)
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
+    # Read and parse the files concurrently, then hand the combined Arrow table to pandas in one call
+    with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+        loaded = [
+            (entry, table)
+            for entry, table in zip(json_files, executor.map(_load_result_file, json_files))
+            if table is not None
+        ]
 
-    return pd.DataFrame(all_results)
+    if not loaded:
+        return pd.DataFrame()
 
+    # Arrow-backed columns skip pandas' per-object type inference
+    df = _merge_result_tables(loaded).to_pandas(types_mapper=pd.ArrowDtype)
+    if df.empty:
+        return df
 
-def plot_operation_comparison(df, output_dir):
-    """Create a plot comparing add/check operations between tools."""
-    # Filter out thread-specific benchmarks
-    df_ops = df[df["source_file"].str.contains("add|update|check")]
-    df_ops = df_ops[df_ops["operation"].isin(COMPARATIVE_OPERATIONS)]
-
-    # Group by relevant factors and calculate mean duration
-    grouped = df_ops.groupby(["tool", "operation", "file_size_kb"]).agg({"duration_ms": ["mean", "std"]}).reset_index()
-
-    # Flatten the MultiIndex
-    grouped.columns = ["_".join(col).strip("_") for col in grouped.columns.values]
-
-    # Create plots for each file size
-    for file_size in grouped["file_size_kb"].unique():
-        plt.figure(figsize=(10, 6))
-
-        # Filter data for this file size
-        df_size = grouped[grouped["file_size_kb"] == file_size]
-
-        # Get file count (should be the same for all operations at this file size)
-        file_count = df_ops[df_ops["file_size_kb"] == file_size]["file_count"].iloc[0]
-
-        # Set up bar positions
-        operations = COMPARATIVE_OPERATIONS
-        x_pos = np.arange(len(operations))
-        width = 0.35
-
-        # Get data for each tool
-        edlicense_data = df_size[df_size["tool"] == "edlicense"]
-        addlicense_data = df_size[df_size["tool"] == "addlicense"]
-
-        # Prepare bar heights and error data
-        edlicense_heights = []
-        edlicense_errors = []
-        addlicense_heights = []
-        addlicense_errors = []
-
-        for op in operations:
-            # edlicense data
-            ed_op_data = edlicense_data[edlicense_data["operation"] == op]
-            if not ed_op_data.empty:
-                edlicense_heights.append(ed_op_data["duration_ms_mean"].values[0])
-                edlicense_errors.append(ed_op_data["duration_ms_std"].values[0])
-            else:
-                edlicense_heights.append(0)
-                edlicense_errors.append(0)
-
-            # addlicense data
-            add_op_data = addlicense_data[addlicense_data["operation"] == op]
-            if not add_op_data.empty:
-                addlicense_heights.append(add_op_data["duration_ms_mean"].values[0])
-                addlicense_errors.append(add_op_data["duration_ms_std"].values[0])
-            else:
-                addlicense_heights.append(0)
-                addlicense_errors.append(0)
-
-        # Create the grouped bar chart
-        plt.bar(
-            x_pos - width / 2,
-            edlicense_heights,
-            width,
-            yerr=edlicense_errors,
-            label="edlicense",
-            color="#5d9cf5",
-            capsize=5,
-        )
-        plt.bar(
-            x_pos + width / 2,
-            addlicense_heights,
-            width,
-            yerr=addlicense_errors,
-            label="addlicense",
-            color="#f55d5d",
-            capsize=5,
+    # Low-cardinality labels: category codes make groupby keys and equality masks cheap
+    for column in ("tool", "operation", "source_file"):
+        df[column] = df[column].astype("category")
+
+    # Classify each row's benchmark kind once instead of re-scanning source_file in every consumer;
+    # on the categorical column the precompiled patterns only run against each distinct file name
+    df["is_thread"] = df["source_file"].str.contains(THREAD_SOURCE_PATTERN)
+    df["is_op"] = df["source_file"].str.contains(OPERATION_SOURCE_PATTERN)
+
+    return df
+
+
+def aggregate_durations(df, keys):
+    """Aggregate duration statistics and the file count for each group of keys."""
+    # Named aggregation yields flat column names directly, with no MultiIndex to flatten
+    return (
+        df.groupby(keys, observed=True)
+        .agg(
+            duration_ms_mean=("duration_ms", "mean"),
+            duration_ms_std=("duration_ms", "std"),
+            duration_ms_min=("duration_ms", "min"),
+            duration_ms_max=("duration_ms", "max"),
+            duration_ms_count=("duration_ms", "count"),
+            file_count_first=("file_count", "first"),
         )
+        .reset_index()
+    )
 
-        # Add labels, title and legend
-        plt.xlabel("Operation")
-        plt.ylabel("Duration (ms)")
-        plt.title(f"Performance Comparison - {file_size}KB Files ({file_count} files)")
-        plt.xticks(x_pos, operations)
-        plt.legend()
-        plt.grid(axis="y", linestyle="--", alpha=0.7)
 
-        # Add value labels on top of bars
-        for i, v in enumerate(edlicense_heights):
-            plt.text(i - width / 2, v + 5, f"{v:.0f}", ha="center", va="bottom", fontsize=9)
+def _lazy_imports():
+    """Import and return pyplot on first use, so runs with --no-plots never load matplotlib."""
+    import matplotlib
 
-        for i, v in enumerate(addlicense_heights):
-            plt.text(i + width / 2, v + 5, f"{v:.0f}", ha="center", va="bottom", fontsize=9)
+    # Force the non-interactive Agg backend (also inherited by the rendering worker processes)
+    matplotlib.use("Agg")
 
-        # Save the figure
-        output_path = os.path.join(output_dir, f"comparison_{file_size}KB.png")
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300)
-        print(f"Saved {output_path}")
-        plt.close()
+    import matplotlib.pyplot as plt
 
+    return plt
 
-def plot_thread_impact(df, output_dir):
-    """Create a plot showing the impact of thread count on edlicense performance."""
-    # Filter for thread count benchmarks
-    df_threads = df[df["source_file"].str.contains("thread_impact")]
 
-    if df_threads.empty:
-        print("No thread impact data found.")
-        return
+# Figure and axes reused by every chart rendered in this process (one per worker process)
+_shared_axes = None
+
+
+def _reusable_axes():
+    """Return this process's shared figure and axes, cleared for the next chart."""
+    global _shared_axes
+    if _shared_axes is None:
+        _shared_axes = _lazy_imports().subplots(figsize=(10, 6))
+
+    fig, ax = _shared_axes
+    ax.clear()
+    return fig, ax
 
-    # Get file count (should be the same for all thread counts)
-    file_count = df_threads["file_count"].iloc[0]
 
-    # Group by thread count and calculate statistics
-    grouped = df_threads.groupby("thread_count").agg({"duration_ms": ["mean", "std"]}).reset_index()
+def _save_chart(fig, output_dir, file_name, dpi):
+    """Save the figure as a PNG in output_dir and return (file_name, png_bytes) for the report."""
+    buf = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buf, format="png", dpi=dpi)
+    png = buf.getvalue()
 
-    # Flatten the MultiIndex
-    grouped.columns = ["_".join(col).strip("_") for col in grouped.columns.values]
+    output_path = os.path.join(output_dir, file_name)
+    with open(output_path, "wb") as f:
+        f.write(png)
+    print(f"Saved {output_path}")
+    return file_name, png
+
+
+def _render_comparison(task):
+    """Render the tool comparison chart for one file size (runs in a worker process)."""
+    file_size, heights, errors, file_count, output_dir, dpi = task
+    operations = COMPARATIVE_OPERATIONS
+
+    fig, ax = _reusable_axes()
+
+    # Set up bar positions
+    x_pos = np.arange(len(operations))
+    width = 0.35
+
+    edlicense_heights, addlicense_heights = heights
+    edlicense_errors, addlicense_errors = errors
+
+    # Create the grouped bar chart
+    edlicense_bars = ax.bar(
+        x_pos - width / 2,
+        edlicense_heights,
+        width,
+        yerr=edlicense_errors,
+        label="edlicense",
+        color="#5d9cf5",
+        capsize=5,
+    )
+    addlicense_bars = ax.bar(
+        x_pos + width / 2,
+        addlicense_heights,
+        width,
+        yerr=addlicense_errors,
+        label="addlicense",
+        color="#f55d5d",
+        capsize=5,
+    )
+
+    # Add labels, title and legend
+    ax.set_xlabel("Operation")
+    ax.set_ylabel("Duration (ms)")
+    ax.set_title(f"Performance Comparison - {file_size}KB Files ({file_count} files)")
+    ax.set_xticks(x_pos, operations)
+    ax.legend()
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+    # Add value labels on top of bars
+    ax.bar_label(edlicense_bars, fmt="%.0f", padding=5, fontsize=9)
+    ax.bar_label(addlicense_bars, fmt="%.0f", padding=5, fontsize=9)
+
+    # Save the figure
+    return _save_chart(fig, output_dir, f"comparison_{file_size}KB.png", dpi)
+
+
+def plot_operation_comparison(grouped, file_counts, output_dir, dpi=DEFAULT_DPI):
+    """Create a plot comparing add/check operations between tools."""
+    operations = COMPARATIVE_OPERATIONS
+    stats = ["duration_ms_mean", "duration_ms_std"]
+
+    # Build one dense file size x (stat, tool, operation) matrix; missing combinations become 0
+    pivot = grouped.pivot_table(
+        index="file_size_kb", columns=["tool", "operation"], values=stats, observed=True
+    ).reindex(columns=pd.MultiIndex.from_product([stats, COMPARED_TOOLS, operations]), fill_value=0)
+
+    # Slice each stat into a (file size, tool, operation) array once, then walk the rows without per-row lookups
+    shape = (len(pivot.index), len(COMPARED_TOOLS), len(operations))
+    means = pivot["duration_ms_mean"].to_numpy(dtype=float).reshape(shape)
+    stds = pivot["duration_ms_std"].to_numpy(dtype=float).reshape(shape)
 
-    plt.figure(figsize=(10, 6))
+    # Collect plain-data tasks for each file size; bar data is a (tool, operation) array
+    tasks = [
+        (file_size, heights, errors, file_counts[file_size], output_dir, dpi)
+        for file_size, heights, errors in zip(pivot.index, means, stds)
+    ]
+
+    # The charts are independent, so render them on separate cores
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_render_comparison, tasks))
+
+
+def plot_thread_impact(grouped, output_dir, dpi=DEFAULT_DPI):
+    """Create a plot showing the impact of thread count on edlicense performance."""
+    if grouped.empty:
+        print("No thread impact data found.")
+        return []
+
+    # Get file count (should be the same for all thread counts)
+    file_count = grouped["file_count_first"].iloc[0]
+
+    fig, ax = _reusable_axes()
 
     # Sort by thread count
     grouped = grouped.sort_values("thread_count")
 
-    # Extract data
+    # Extract data (as float arrays, so a single-run std is NaN rather than pd.NA)
     thread_counts = grouped["thread_count"].tolist()
-    durations = grouped["duration_ms_mean"].tolist()
-    errors = grouped["duration_ms_std"].tolist()
+    durations = grouped["duration_ms_mean"].to_numpy(dtype=float)
+    errors = grouped["duration_ms_std"].to_numpy(dtype=float)
 
     # Create the bar chart
-    bars = plt.bar(thread_counts, durations, yerr=errors, capsize=5, color="#5d9cf5")
+    bars = ax.bar(thread_counts, durations, yerr=errors, capsize=5, color="#5d9cf5")
 
     # Add labels and title
-    plt.xlabel("Thread Count")
-    plt.ylabel("Duration (ms)")
-    plt.title(f"Impact of Thread Count on edlicense Performance ({file_count} files)")
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.set_xlabel("Thread Count")
+    ax.set_ylabel("Duration (ms)")
+    ax.set_title(f"Impact of Thread Count on edlicense Performance ({file_count} files)")
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
 
     # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width() / 2.0, height + 5, f"{height:.0f}", ha="center", va="bottom", fontsize=9)
+    ax.bar_label(bars, fmt="%.0f", padding=5, fontsize=9)
 
     # Save the figure
-    output_path = os.path.join(output_dir, "thread_impact.png")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300)
-    print(f"Saved {output_path}")
-    plt.close()
+    return [_save_chart(fig, output_dir, "thread_impact.png", dpi)]
 
 
-def plot_file_size_impact(df, output_dir):
-    """Create a plot showing the impact of file size on performance."""
-    # Filter out thread-specific benchmarks
-    df_sizes = df[~df["source_file"].str.contains("thread_impact")]
-    df_sizes = df_sizes[df_sizes["operation"].isin(COMPARATIVE_OPERATIONS)]
+def _render_file_size_impact(task):
+    """Render the file size impact chart for one operation (runs in a worker process)."""
+    operation, tool_series, file_sizes, file_counts, output_dir, dpi = task
 
-    # Group by relevant factors and calculate mean duration
-    grouped = df_sizes.groupby(["tool", "operation", "file_size_kb"]).agg({"duration_ms": ["mean"]}).reset_index()
+    fig, ax = _reusable_axes()
 
-    # Flatten the MultiIndex
-    grouped.columns = ["_".join(col).strip("_") for col in grouped.columns.values]
+    for tool, sizes, durations in tool_series:
+        # Plot line for this tool
+        ax.plot(sizes, durations, marker="o", linewidth=2, label=tool)
 
-    # Create plots for each operation
-    for operation in grouped["operation"].unique():
-        plt.figure(figsize=(10, 6))
+    # Add labels and title
+    ax.set_xlabel("File Size (KB)")
+    ax.set_ylabel("Duration (ms)")
+    ax.set_title(f"Impact of File Size on {operation.capitalize()} Operation")
+    ax.legend()
+    ax.grid(linestyle="--", alpha=0.7)
+
+    # Add file count annotations
+    for i, size in enumerate(file_sizes):
+        ax.annotate(
+            f"{file_counts[size]} files",
+            xy=(size, 0),
+            xytext=(0, 10),
+            textcoords="offset points",
+            ha="center",
+            va="bottom",
+            fontsize=8,
+        )
+
+    # Use log scale for x-axis to better show the range
+    ax.set_xscale("log")
+    ax.set_xticks(file_sizes, [str(size) for size in file_sizes])
+
+    # Save the figure
+    return _save_chart(fig, output_dir, f"filesize_impact_{operation}.png", dpi)
+
+
+def plot_file_size_impact(grouped, file_sizes, file_counts, output_dir, dpi=DEFAULT_DPI):
+    """Create a plot showing the impact of file size on performance."""
+    tasks = []
 
+    # Collect plain-data tasks for each operation
+    for operation in grouped["operation"].unique():
         # Filter data for this operation
         df_op = grouped[grouped["operation"] == operation]
 
-        # Get file counts for each file size
-        file_counts = {}
-        for size in sorted(df_op["file_size_kb"].unique()):
-            # Get file count for this size (should be the same for all tools)
-            file_count = df_sizes[df_sizes["file_size_kb"] == size]["file_count"].iloc[0]
-            file_counts[size] = file_count
-
         # Prepare data for each tool
-        tools = df_op["tool"].unique()
-        file_sizes = sorted(df_op["file_size_kb"].unique())
-
-        for tool in tools:
+        tool_series = []
+        for tool in df_op["tool"].unique():
             tool_data = df_op[df_op["tool"] == tool]
             tool_data = tool_data.sort_values("file_size_kb")
-
-            # Plot line for this tool
-            plt.plot(tool_data["file_size_kb"], tool_data["duration_ms_mean"], marker="o", linewidth=2, label=tool)
-
-        # Add labels and title
-        plt.xlabel("File Size (KB)")
-        plt.ylabel("Duration (ms)")
-        plt.title(f"Impact of File Size on {operation.capitalize()} Operation")
-        plt.legend()
-        plt.grid(linestyle="--", alpha=0.7)
-
-        # Add file count annotations
-        for i, size in enumerate(file_sizes):
-            plt.annotate(
-                f"{file_counts[size]} files",
-                xy=(size, 0),
-                xytext=(0, 10),
-                textcoords="offset points",
-                ha="center",
-                va="bottom",
-                fontsize=8,
+            tool_series.append(
+                (tool, tool_data["file_size_kb"].to_numpy(), tool_data["duration_ms_mean"].to_numpy(dtype=float))
             )
 
-        # Use log scale for x-axis to better show the range
-        plt.xscale("log")
-        plt.xticks(file_sizes, [str(size) for size in file_sizes])
+        # Keep the shared size order, limited to the sizes this operation was run with
+        op_sizes = set(df_op["file_size_kb"])
+        sizes = [size for size in file_sizes if size in op_sizes]
+        tasks.append((operation, tool_series, sizes, file_counts, output_dir, dpi))
 
-        # Save the figure
-        output_path = os.path.join(output_dir, f"filesize_impact_{operation}.png")
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300)
-        print(f"Saved {output_path}")
-        plt.close()
+    # The charts are independent, so render them on separate cores
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_render_file_size_impact, tasks))
 
 
-def generate_summary_table(df, output_dir):
+def generate_summary_table(grouped, output_dir):
     """Generate a summary table of benchmark results."""
-    # Filter out thread-specific benchmarks
-    df_summary = df[~df["source_file"].str.contains("thread_impact")]
-    df_summary = df_summary[df_summary["operation"].isin(COMPARATIVE_OPERATIONS)]
-
-    # Group by relevant factors and calculate statistics
-    grouped = (
-        df_summary.groupby(["tool", "operation", "file_size_kb"])
-        .agg(
-            {
-                "duration_ms": ["mean", "std", "min", "max"],
-                "file_count": ["first"],
-            }
+    # Spread the per-tool means side by side, keeping only cells measured for both tools
+    wide = (
+        grouped.pivot_table(
+            index=["operation", "file_size_kb"],
+            columns="tool",
+            values="duration_ms_mean",
+            aggfunc="first",
+            observed=True,
         )
-        .reset_index()
+        .reindex(columns=COMPARED_TOOLS)
+        .dropna()
+    )
+    file_counts = (
+        grouped[grouped["tool"] == "edlicense"]
+        .set_index(["operation", "file_size_kb"])["file_count_first"]
+        .reindex(wide.index)
     )
 
-    # Flatten the MultiIndex
-    grouped.columns = ["_".join(col).strip("_") for col in grouped.columns.values]
-
-    # Calculate performance ratio (addlicense / edlicense)
-    summary_data = []
-
-    for op in grouped["operation"].unique():
-        for size in sorted(grouped["file_size_kb"].unique()):
-            ed_data = grouped[
-                (grouped["tool"] == "edlicense") & (grouped["operation"] == op) & (grouped["file_size_kb"] == size)
-            ]
-
-            add_data = grouped[
-                (grouped["tool"] == "addlicense") & (grouped["operation"] == op) & (grouped["file_size_kb"] == size)
-            ]
-
-            if not ed_data.empty and not add_data.empty:
-                ed_mean = ed_data["duration_ms_mean"].values[0]
-                add_mean = add_data["duration_ms_mean"].values[0]
-
-                ratio = add_mean / ed_mean if ed_mean > 0 else 0
-                percent_diff = ((add_mean - ed_mean) / ed_mean) * 100 if ed_mean > 0 else 0
-
-                summary_data.append(
-                    {
-                        "Operation": op,
-                        "File Size (KB)": size,
-                        "File Count": int(ed_data["file_count_first"].values[0]),
-                        "edlicense (ms)": round(ed_mean, 2),
-                        "addlicense (ms)": round(add_mean, 2),
-                        "Ratio (addlicense/edlicense)": round(ratio, 2),
-                        "Percent Difference": f"{round(percent_diff, 1)}%",
-                    }
-                )
-
-    # Create DataFrame from summary data
-    summary_df = pd.DataFrame(summary_data)
+    # Calculate performance ratio (addlicense / edlicense) for every cell at once
+    ed_mean = wide["edlicense"].to_numpy()
+    add_mean = wide["addlicense"].to_numpy()
+    valid = ed_mean > 0
+    safe_ed_mean = np.where(valid, ed_mean, 1)
+    ratio = np.where(valid, add_mean / safe_ed_mean, 0)
+    percent_diff = np.where(valid, (add_mean - ed_mean) / safe_ed_mean * 100, 0)
+
+    summary_df = pd.DataFrame(
+        {
+            "Operation": wide.index.get_level_values("operation"),
+            "File Size (KB)": wide.index.get_level_values("file_size_kb"),
+            "File Count": file_counts.to_numpy(dtype=int),
+            "edlicense (ms)": ed_mean.round(2),
+            "addlicense (ms)": add_mean.round(2),
+            "Ratio (addlicense/edlicense)": ratio.round(2),
+            "Percent Difference": [f"{value}%" for value in percent_diff.round(1).tolist()],
+        },
+        columns=SUMMARY_COLUMNS,
+    )
 
     # Write to CSV
     csv_path = os.path.join(output_dir, "benchmark_summary.csv")
@@ -328,24 +405,18 @@ def generate_summary_table(df, output_dir):
     return summary_df
 
 
-def plot_speedup_comparison(summary_df, output_dir):
+def plot_speedup_comparison(summary_df, file_counts, output_dir, dpi=DEFAULT_DPI):
     """Create a plot showing the speedup ratio between tools."""
     if summary_df.empty:
         print("No summary data available for speedup comparison.")
-        return
+        return []
 
-    plt.figure(figsize=(10, 6))
+    fig, ax = _reusable_axes()
 
-    # Get unique operations and file sizes
+    # Get unique operations and the file sizes measured for both tools
     operations = summary_df["Operation"].unique()
     file_sizes = sorted(summary_df["File Size (KB)"].unique())
 
-    # Get file counts for each file size
-    file_counts = {}
-    for size in file_sizes:
-        file_count = summary_df[summary_df["File Size (KB)"] == size]["File Count"].iloc[0]
-        file_counts[size] = file_count
-
     # Set up bar positions
     x_pos = np.arange(len(file_sizes))
     width = 0.25
@@ -357,31 +428,28 @@ def plot_speedup_comparison(summary_df, output_dir):
 
         ratios = op_data["Ratio (addlicense/edlicense)"].tolist()
 
-        plt.bar(x_pos + (i - 1) * width, ratios, width, label=operation, alpha=0.8)
+        ax.bar(x_pos + (i - 1) * width, ratios, width, label=operation, alpha=0.8)
 
     # Add reference line for ratio=1 (equal performance)
-    plt.axhline(y=1, color="r", linestyle="--", alpha=0.5, label="Equal Performance")
+    ax.axhline(y=1, color="r", linestyle="--", alpha=0.5, label="Equal Performance")
 
     # Add labels and title
-    plt.xlabel("File Size (KB)")
-    plt.ylabel("Speedup Ratio (addlicense/edlicense)")
-    plt.title("Performance Comparison: Speedup Ratio")
-    plt.xticks(x_pos, [f"{size} KB\n({file_counts[size]} files)" for size in file_sizes])
-    plt.legend()
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.set_xlabel("File Size (KB)")
+    ax.set_ylabel("Speedup Ratio (addlicense/edlicense)")
+    ax.set_title("Performance Comparison: Speedup Ratio")
+    ax.set_xticks(x_pos, [f"{size} KB\n({file_counts[size]} files)" for size in file_sizes])
+    ax.legend()
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
 
     # Save the figure
-    output_path = os.path.join(output_dir, "speedup_ratio.png")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300)
-    print(f"Saved {output_path}")
-    plt.close()
+    return [_save_chart(fig, output_dir, "speedup_ratio.png", dpi)]
 
 
-def generate_report(df, summary_df, output_dir):
+def generate_report(df, summary_df, charts, output_dir):
     """Generate an HTML report with all benchmark results."""
     # Create a simple HTML report
-    html_content = f"""
+    parts = [
+        f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -419,66 +487,53 @@ def generate_report(df, summary_df, output_dir):
         
         <div class="section">
             <h2>Summary Table</h2>
-            <table border="1">
-                <tr>
-                    <th>Operation</th>
-                    <th>File Size (KB)</th>
-                    <th>File Count</th>
-                    <th>edlicense (ms)</th>
-                    <th>addlicense (ms)</th>
-                    <th>Ratio (addlicense/edlicense)</th>
-                    <th>Percent Difference</th>
-                </tr>
     """
+    ]
+
+    # Highlight the ratio and percent difference wherever addlicense is slower, then let pandas emit the table
+    display_df = summary_df.astype(str)
+    highlight = summary_df["Ratio (addlicense/edlicense)"] > 1
+    for column in ("Ratio (addlicense/edlicense)", "Percent Difference"):
+        display_df[column] = display_df[column].where(
+            ~highlight, '<span class="highlight">' + display_df[column] + "</span>"
+        )
 
-    # Add summary table rows
-    for _, row in summary_df.iterrows():
-        ratio = row["Ratio (addlicense/edlicense)"]
-        highlight = "highlight" if ratio > 1 else ""
-
-        html_content += f"""
-                <tr>
-                    <td>{row["Operation"]}</td>
-                    <td>{row["File Size (KB)"]}</td>
-                    <td>{row["File Count"]}</td>
-                    <td>{row["edlicense (ms)"]}</td>
-                    <td>{row["addlicense (ms)"]}</td>
-                    <td class="{highlight}">{ratio}</td>
-                    <td class="{highlight}">{row["Percent Difference"]}</td>
-                </tr>
-        """
+    parts.append(display_df.to_html(index=False, border=1, escape=False, justify="left"))
 
-    html_content += """
-            </table>
+    parts.append(
+        """
         </div>
         
         <div class="section">
             <h2>Performance Comparisons</h2>
     """
+    )
 
-    # Add all generated charts
-    chart_files = sorted(glob.glob(os.path.join(output_dir, "*.png")))
-    for chart_file in chart_files:
-        file_name = os.path.basename(chart_file)
+    # Embed the charts rendered in this run, so the report is self-contained
+    for file_name, png in sorted(charts):
         chart_title = file_name.replace(".png", "").replace("_", " ").title()
+        encoded = base64.b64encode(png).decode("ascii")
 
-        html_content += f"""
+        parts.append(
+            f"""
             <div>
                 <h3>{chart_title}</h3>
-                <img src="{file_name}" alt="{chart_title}">
+                <img src="data:image/png;base64,{encoded}" alt="{chart_title}">
             </div>
         """
+        )
 
-    html_content += """
+    parts.append(
+        """
         </div>
     </body>
     </html>
     """
+    )
 
     # Write HTML report
     report_path = os.path.join(output_dir, "benchmark_report.html")
-    with open(report_path, "w") as f:
-        f.write(html_content)
+    Path(report_path).write_text("".join(parts), encoding="utf-8")
 
     print(f"Generated HTML report at {report_path}")
 
@@ -489,6 +544,12 @@ def main():
         "--results-dir", default="target/benchmark_results", help="Directory containing benchmark JSON results"
     )
     parser.add_argument("--output-dir", default="benchmark_visualizations", help="Directory to save visualizations")
+    parser.add_argument(
+        "--dpi", type=int, default=DEFAULT_DPI, help=f"Resolution of the rendered charts (default: {DEFAULT_DPI})"
+    )
+    parser.add_argument(
+        "--no-plots", action="store_true", help="Only write the summary table and report, without rendering charts"
+    )
 
     args = parser.parse_args()
 
@@ -502,19 +563,32 @@ def main():
         print("No benchmark results found.")
         return
 
-    # Generate visualizations
-    plot_operation_comparison(df, args.output_dir)
-    plot_thread_impact(df, args.output_dir)
-    plot_file_size_impact(df, args.output_dir)
+    # Aggregate once per benchmark subset and share the results between the plots and the summary
+    is_comparative = df["operation"].isin(COMPARATIVE_OPERATIONS)
+    op_grouped = aggregate_durations(df[df["is_op"] & is_comparative], GROUP_KEYS)
+    size_grouped = aggregate_durations(df[~df["is_thread"] & is_comparative], GROUP_KEYS)
+    thread_grouped = aggregate_durations(df[df["is_thread"]], ["thread_count"])
 
-    # Generate summary table
-    summary_df = generate_summary_table(df, args.output_dir)
+    # Every chart labels file sizes with their file counts (the same for all tools and operations), so derive them once
+    file_counts = size_grouped.drop_duplicates("file_size_kb").set_index("file_size_kb")["file_count_first"].to_dict()
+    file_sizes = sorted(file_counts)
 
-    # Generate speedup comparison
-    plot_speedup_comparison(summary_df, args.output_dir)
+    # Generate summary table
+    summary_df = generate_summary_table(size_grouped, args.output_dir)
+
+    # Generate visualizations, keeping the PNG bytes for the report
+    charts = []
+    if not args.no_plots:
+        charts = [
+            *plot_operation_comparison(op_grouped, file_counts, args.output_dir, args.dpi),
+            *plot_thread_impact(thread_grouped, args.output_dir, args.dpi),
+            *plot_file_size_impact(size_grouped, file_sizes, file_counts, args.output_dir, args.dpi),
+            *plot_speedup_comparison(summary_df, file_counts, args.output_dir, args.dpi),
+        ]
+        _lazy_imports().close("all")
 
     # Generate HTML report
-    generate_report(df, summary_df, args.output_dir)
+    generate_report(df, summary_df, charts, args.output_dir)
 
     print("Visualization complete!")
 